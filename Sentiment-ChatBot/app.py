@@ -10,6 +10,7 @@ sys.path.append(os.path.abspath(os.path.dirname(__file__)))
 from sentiment_analysis import SentimentAnalyzer
 from response_generation import ResponseGenerator
 from conversation_manager import ConversationManager
+from sentiment_analytics import SentimentAnalytics
 
 # Load environment variables
 load_dotenv()
@@ -23,6 +24,25 @@ def get_sentiment_color(sentiment):
     else:
         return "#6c757d"  # Gray
 
+def show_sentiment_analytics(analytics):
+    """Display the session's sentiment analytics."""
+    st.subheader("Conversation Sentiment")
+    st.bar_chart(analytics.sentiment_counts)
+
+    if analytics.count > 0:
+        col1, col2 = st.columns(2)
+        col1.metric("Recent mood", f"{analytics.rolling_average():+.2f}")
+        col2.metric("Overall mood", f"{analytics.session_average():+.2f}")
+
+        st.subheader("Sentiment Trend")
+        st.line_chart(analytics.get_trajectory())
+
+        st.subheader("Emotions")
+        st.bar_chart(analytics.get_emotion_histogram())
+
+        if analytics.in_negative_streak():
+            st.warning(f"{analytics.negative_streak} negative messages in a row")
+
 def main():
     st.set_page_config(
         page_title="Sentiment-Aware Chatbot",
@@ -55,12 +75,12 @@ def main():
 
         if st.button("Clear Conversation"):
             st.session_state.conversation_manager.clear_conversation()
+            st.session_state.sentiment_analytics.reset()
             st.session_state.messages = []
             st.rerun()
 
-        if 'sentiment_stats' in st.session_state:
-            st.subheader("Conversation Sentiment")
-            st.bar_chart(st.session_state.sentiment_stats)
+        # Filled in at the end of the run, after the latest message is analyzed
+        sentiment_container = st.container()
 
         st.markdown("---")
         st.markdown("Built with Gemini API")
@@ -81,12 +101,8 @@ def main():
     if 'messages' not in st.session_state:
         st.session_state.messages = []
 
-    if 'sentiment_stats' not in st.session_state:
-        st.session_state.sentiment_stats = {
-            'positive': 0,
-            'negative': 0,
-            'neutral': 0
-        }
+    if 'sentiment_analytics' not in st.session_state:
+        st.session_state.sentiment_analytics = SentimentAnalytics()
 
     # Display existing messages
     for message in st.session_state.messages:
@@ -115,8 +131,7 @@ def main():
         # Analyze user input
         with st.spinner("Analyzing sentiment..."):
             sentiment_result = st.session_state.sentiment_analyzer.analyze_sentiment(prompt)
-            sentiment = sentiment_result.get('sentiment', 'neutral')
-            st.session_state.sentiment_stats[sentiment] += 1
+            st.session_state.sentiment_analytics.update(sentiment_result)
 
         # Add user message to history
         st.session_state.messages.append({
@@ -153,7 +168,8 @@ def main():
             response = st.session_state.response_generator.generate_response(
                 prompt,
                 sentiment_result,
-                conversation_history
+                conversation_history,
+                st.session_state.sentiment_analytics.get_prompt_context()
             )
 
         # Add assistant message
@@ -171,5 +187,8 @@ def main():
         # Save updated conversation
         st.session_state.conversation_manager.save_conversation()
 
+    with sentiment_container:
+        show_sentiment_analytics(st.session_state.sentiment_analytics)
+
 if __name__ == "__main__":
     main()
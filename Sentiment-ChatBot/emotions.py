@@ -0,0 +1,32 @@
+# Keywords used to recognize each base emotion
+EMOTION_KEYWORDS = {
+    'happy': ['happy', 'joy', 'delighted', 'pleased', 'glad', 'excited'],
+    'sad': ['sad', 'unhappy', 'depressed', 'down', 'miserable', 'heartbroken'],
+    'angry': ['angry', 'mad', 'furious', 'annoyed', 'irritated', 'frustrated'],
+    'afraid': ['afraid', 'scared', 'frightened', 'terrified', 'anxious', 'worried'],
+    'surprised': ['surprised', 'shocked', 'amazed', 'astonished', 'stunned'],
+    'disgusted': ['disgusted', 'revolted', 'repulsed', 'sickened']
+}
+
+# Extra noun forms and synonyms for normalizing the emotion labels the model
+# reports; kept apart from EMOTION_KEYWORDS, which is also scanned for as
+# substrings of raw response text
+EMOTION_SYNONYMS = {
+    'happy': ['happiness', 'joyful', 'joyous', 'delight', 'excitement', 'cheerful',
+              'elated', 'elation', 'enthusiastic', 'enthusiasm', 'amused', 'amusement',
+              'grateful', 'gratitude', 'relieved', 'relief', 'hopeful', 'optimistic',
+              'proud', 'love', 'satisfied', 'satisfaction', 'contentment'],
+    'sad': ['sadness', 'sorrow', 'sorrowful', 'grief', 'grieving', 'lonely', 'loneliness',
+            'disappointed', 'disappointment', 'depression', 'heartbreak', 'misery',
+            'hopeless', 'hopelessness', 'hurt', 'melancholy', 'gloomy', 'upset', 'regret'],
+    'angry': ['anger', 'rage', 'enraged', 'fury', 'annoyance', 'irritation', 'frustration',
+              'resentful', 'resentment', 'outraged', 'outrage', 'hostile', 'irate'],
+    'afraid': ['fear', 'fearful', 'anxiety', 'nervous', 'nervousness', 'worry', 'panic',
+               'panicked', 'stressed', 'stress', 'dread', 'uneasy', 'apprehensive',
+               'apprehension', 'insecure', 'insecurity'],
+    'surprised': ['surprise', 'shock', 'amazement', 'astonishment', 'startled', 'awe'],
+    'disgusted': ['disgust', 'revulsion', 'repulsion', 'contempt', 'grossed']
+}
+
+# Labels the model uses to say that no emotion was detected
+NO_EMOTION_LABELS = ['none', 'null', 'neutral', 'n/a', 'na', 'nothing', 'no emotion', 'unknown']
@@ -5,7 +5,7 @@ class ResponseGenerator:
         """Initialize the response generator."""
         self.gemini_client = GeminiClient()
         
-    def generate_response(self, user_input, sentiment_result, conversation_history=None):
+    def generate_response(self, user_input, sentiment_result, conversation_history=None, analytics_context=None):
         """
         Generate a response using Gemini API based on user input and sentiment analysis.
         
@@ -13,6 +13,7 @@ class ResponseGenerator:
             user_input (str): The user's message
             sentiment_result (dict): The sentiment analysis result
             conversation_history (list, optional): List of previous messages
+            analytics_context (str, optional): Summary of the conversation's sentiment trend
             
         Returns:
             str: The generated response
@@ -33,6 +34,9 @@ class ResponseGenerator:
         if emotion:
             system_prompt += f" They appear to be feeling {emotion}."
             
+        if analytics_context:
+            system_prompt += f" {analytics_context}"
+            
         system_prompt += """
         Respond in a way that acknowledges their emotional state and provides an appropriate, 
         supportive response. Keep your response concise (1-3 sentences) and conversational.
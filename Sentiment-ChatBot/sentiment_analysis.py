@@ -1,5 +1,6 @@
 import json
 from gemini_client import GeminiClient
+from emotions import EMOTION_KEYWORDS
 
 class SentimentAnalyzer:
     def __init__(self):
@@ -109,16 +110,7 @@ class SentimentAnalyzer:
                     sentiment = "negative"
                 
                 # Try to extract emotion keywords
-                emotion_keywords = {
-                    'happy': ['happy', 'joy', 'delighted', 'pleased', 'glad', 'excited'],
-                    'sad': ['sad', 'unhappy', 'depressed', 'down', 'miserable', 'heartbroken'],
-                    'angry': ['angry', 'mad', 'furious', 'annoyed', 'irritated', 'frustrated'],
-                    'afraid': ['afraid', 'scared', 'frightened', 'terrified', 'anxious', 'worried'],
-                    'surprised': ['surprised', 'shocked', 'amazed', 'astonished', 'stunned'],
-                    'disgusted': ['disgusted', 'revolted', 'repulsed', 'sickened']
-                }
-                
-                for emo, keywords in emotion_keywords.items():
+                for emo, keywords in EMOTION_KEYWORDS.items():
                     if any(keyword in response_text.lower() for keyword in keywords):
                         emotion = emo
                         break
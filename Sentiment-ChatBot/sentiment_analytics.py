@@ -0,0 +1,329 @@
+import json
+import re
+import numpy as np
+from emotions import EMOTION_KEYWORDS, EMOTION_SYNONYMS, NO_EMOTION_LABELS
+
+SENTIMENT_SCORES = {
+    'positive': 1.0,
+    'neutral': 0.0,
+    'negative': -1.0
+}
+
+EMOTIONS = list(EMOTION_KEYWORDS) + ['other', 'none']
+
+# Reverse lookup from keyword to base emotion, first emotion wins on overlap
+KEYWORD_EMOTIONS = {}
+for _table in (EMOTION_KEYWORDS, EMOTION_SYNONYMS):
+    for _emotion, _keywords in _table.items():
+        for _keyword in _keywords:
+            KEYWORD_EMOTIONS.setdefault(_keyword, _emotion)
+
+def normalize_emotion(emotion):
+    """
+    Map a free-form emotion onto one of the base emotions.
+
+    Args:
+        emotion (str): Emotion returned by the sentiment analyzer, e.g. "joy" or "anxious"
+
+    Returns:
+        str: A value from EMOTIONS; 'none' if empty or a "no emotion" label such as
+        "neutral", 'other' if unrecognized
+    """
+    if not emotion:
+        return 'none'
+
+    emotion = str(emotion).strip().lower()
+    if emotion in NO_EMOTION_LABELS:
+        return 'none'
+
+    # Match whole words so that e.g. "unhappy" is not counted as "happy"
+    for word in re.findall(r"[a-z]+", emotion):
+        if word in KEYWORD_EMOTIONS:
+            return KEYWORD_EMOTIONS[word]
+
+    return 'other'
+
+class SentimentAnalytics:
+    def __init__(self, window_size=5, ema_alpha=0.3, streak_threshold=3, capacity=64):
+        """
+        Initialize the incremental sentiment analytics for a session.
+
+        Args:
+            window_size (int): Number of recent messages in the rolling window
+            ema_alpha (float): Smoothing factor for the exponential moving average
+            streak_threshold (int): Consecutive negative messages that count as a negative streak
+            capacity (int): Initial number of messages to preallocate trajectory storage for
+        """
+        self.window_size = max(1, int(window_size))
+        self.ema_alpha = float(ema_alpha)
+        self.streak_threshold = max(1, int(streak_threshold))
+        self.initial_capacity = max(1, int(capacity))
+        self.reset()
+
+    def reset(self):
+        """Clear all analytics and reallocate the storage arrays."""
+        self.count = 0
+
+        # Full trajectory, grown by doubling so appends stay amortized O(1)
+        self.scores = np.zeros(self.initial_capacity, dtype=np.float64)
+        self.confidences = np.zeros(self.initial_capacity, dtype=np.float64)
+        self.ema_values = np.zeros(self.initial_capacity, dtype=np.float64)
+
+        # Ring buffers for the rolling window
+        self.window_scores = np.zeros(self.window_size, dtype=np.float64)
+        self.window_weights = np.zeros(self.window_size, dtype=np.float64)
+
+        self.sentiment_counts = {sentiment: 0 for sentiment in SENTIMENT_SCORES}
+        self.emotion_counts = np.zeros(len(EMOTIONS), dtype=np.int64)
+        self.emotion_index = {emotion: i for i, emotion in enumerate(EMOTIONS)}
+
+        self.ema = 0.0
+        self.negative_streak = 0
+        self.max_negative_streak = 0
+
+    def _ensure_capacity(self):
+        """Double the trajectory arrays when they are full."""
+        if self.count < len(self.scores):
+            return
+
+        new_capacity = len(self.scores) * 2
+        for name in ('scores', 'confidences', 'ema_values'):
+            old = getattr(self, name)
+            new = np.zeros(new_capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def update(self, sentiment_result):
+        """
+        Add a sentiment analysis result to the analytics.
+
+        Args:
+            sentiment_result (dict): Result returned by SentimentAnalyzer.analyze_sentiment
+        """
+        if not sentiment_result:
+            return
+
+        sentiment = str(sentiment_result.get('sentiment', 'neutral')).lower()
+        if sentiment not in SENTIMENT_SCORES:
+            sentiment = 'neutral'
+        score = SENTIMENT_SCORES[sentiment]
+
+        try:
+            confidence = float(sentiment_result.get('confidence', 0.5))
+        except (TypeError, ValueError):
+            confidence = 0.5
+        if not np.isfinite(confidence):
+            confidence = 0.5
+        confidence = min(max(confidence, 0.0), 1.0)
+
+        emotion = normalize_emotion(sentiment_result.get('emotion'))
+
+        # Rolling window: overwrite the oldest slot of the ring buffers
+        slot = self.count % self.window_size
+        self.window_scores[slot] = score
+        self.window_weights[slot] = confidence
+
+        # Confidence-weighted EMA: low-confidence results move the average less
+        if self.count == 0:
+            self.ema = score * confidence
+        else:
+            self.ema += self.ema_alpha * confidence * (score - self.ema)
+
+        if sentiment == 'negative':
+            self.negative_streak += 1
+            self.max_negative_streak = max(self.max_negative_streak, self.negative_streak)
+        else:
+            self.negative_streak = 0
+
+        self.sentiment_counts[sentiment] += 1
+        self.emotion_counts[self.emotion_index[emotion]] += 1
+
+        self._ensure_capacity()
+        self.scores[self.count] = score
+        self.confidences[self.count] = confidence
+        self.ema_values[self.count] = self.ema
+        self.count += 1
+
+    def rolling_average(self):
+        """
+        Get the mean sentiment score over the rolling window.
+
+        Returns:
+            float: Score between -1.0 (negative) and 1.0 (positive)
+        """
+        filled = min(self.count, self.window_size)
+        if filled == 0:
+            return 0.0
+        # Summed from the fixed-size buffer rather than kept as a running total,
+        # so no floating-point error builds up as old values are evicted
+        return float(self.window_scores[:filled].sum()) / filled
+
+    def session_average(self):
+        """
+        Get the mean sentiment score over the whole session.
+
+        Returns:
+            float: Score between -1.0 (negative) and 1.0 (positive)
+        """
+        if self.count == 0:
+            return 0.0
+        return (self.sentiment_counts['positive'] - self.sentiment_counts['negative']) / self.count
+
+    def rolling_weighted_average(self):
+        """
+        Get the confidence-weighted mean sentiment score over the rolling window.
+
+        Returns:
+            float: Score between -1.0 (negative) and 1.0 (positive)
+        """
+        filled = min(self.count, self.window_size)
+        weights = self.window_weights[:filled]
+        weight_total = float(weights.sum())
+        if weight_total <= 0:
+            return 0.0
+        return float(np.dot(self.window_scores[:filled], weights)) / weight_total
+
+    def in_negative_streak(self):
+        """Return True if the latest messages form a negative streak."""
+        return self.negative_streak >= self.streak_threshold
+
+    def get_emotion_histogram(self):
+        """
+        Get the emotion counts for the session.
+
+        Returns:
+            dict: Mapping of emotion name to count
+        """
+        return {emotion: int(count) for emotion, count in zip(EMOTIONS, self.emotion_counts)}
+
+    def get_dominant_emotion(self):
+        """
+        Get the most frequent detected emotion, ignoring messages without one.
+
+        Returns:
+            str: The dominant emotion, or None if no emotion was detected
+        """
+        detected = self.emotion_counts[:self.emotion_index['none']]
+        if detected.sum() == 0:
+            return None
+        return EMOTIONS[int(np.argmax(detected))]
+
+    def get_trajectory(self):
+        """
+        Get the per-message sentiment trajectory.
+
+        Returns:
+            dict: Lists of raw scores and EMA values, one entry per user message
+        """
+        return {
+            'score': self.scores[:self.count].tolist(),
+            'ema': self.ema_values[:self.count].tolist()
+        }
+
+    def get_summary(self):
+        """
+        Get a snapshot of the current analytics.
+
+        Returns:
+            dict: Summary of counts, averages, emotions and streaks
+        """
+        return {
+            'messages': self.count,
+            'sentiment_counts': dict(self.sentiment_counts),
+            'session_average': self.session_average(),
+            'rolling_average': self.rolling_average(),
+            'rolling_weighted_average': self.rolling_weighted_average(),
+            'ema': self.ema,
+            'dominant_emotion': self.get_dominant_emotion(),
+            'emotion_histogram': self.get_emotion_histogram(),
+            'negative_streak': self.negative_streak,
+            'max_negative_streak': self.max_negative_streak,
+            'in_negative_streak': self.in_negative_streak()
+        }
+
+    def get_prompt_context(self):
+        """
+        Describe the conversation's emotional trend for the response prompt.
+
+        Returns:
+            str: A short description, or an empty string if there is no data yet
+        """
+        if self.count < 2:
+            return ""
+
+        overall = self.session_average()
+        if overall > 0.25:
+            trend = "mostly positive"
+        elif overall < -0.25:
+            trend = "mostly negative"
+        else:
+            trend = "mixed or neutral"
+
+        context = f"Over the conversation so far, the user's mood has been {trend}."
+
+        # Both averages are unweighted, so a gap reflects a change in mood rather
+        # than confidence weighting; until the window has filled it covers the
+        # same messages as the session and there is no trend to report
+        if self.count > self.window_size:
+            recent = self.rolling_average()
+            if recent - overall > 0.3:
+                context += " Their mood has been improving recently."
+            elif overall - recent > 0.3:
+                context += " Their mood has been getting worse recently."
+
+        dominant_emotion = self.get_dominant_emotion()
+        if dominant_emotion and dominant_emotion != 'other':
+            context += f" The emotion they have expressed most often is {dominant_emotion}."
+
+        if self.in_negative_streak():
+            context += (f" Their last {self.negative_streak} messages have all been negative,"
+                        " so be especially gentle and supportive.")
+
+        return context
+
+    def load_conversation(self, conversation):
+        """
+        Rebuild the analytics from stored conversation messages.
+
+        Args:
+            conversation (list): Message dictionaries as stored by ConversationManager
+
+        Returns:
+            bool: True if successful, False if the conversation is not a list
+        """
+        self.reset()
+        if not isinstance(conversation, list):
+            return False
+
+        for message in conversation:
+            if not isinstance(message, dict) or message.get("role") != "user":
+                continue
+            sentiment_result = message.get("sentiment")
+            if isinstance(sentiment_result, dict):
+                self.update(sentiment_result)
+
+        return True
+
+    @classmethod
+    def from_conversation_file(cls, filepath, **kwargs):
+        """
+        Build analytics from a saved conversation file without calling the API.
+
+        Args:
+            filepath (str): Path to a conversation JSON file
+            **kwargs: Options passed to the SentimentAnalytics constructor
+
+        Returns:
+            SentimentAnalytics: The rebuilt analytics
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not valid JSON or does not contain a list of messages
+        """
+        with open(filepath, 'r') as f:
+            conversation = json.load(f)
+
+        analytics = cls(**kwargs)
+        if not analytics.load_conversation(conversation):
+            raise ValueError(f"Conversation file {filepath} does not contain a list of messages")
+        return analytics
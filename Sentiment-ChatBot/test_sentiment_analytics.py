@@ -0,0 +1,205 @@
+import sys
+import os
+import json
+import tempfile
+
+# Add the src directory to the Python path
+sys.path.append(os.path.dirname(__file__))
+
+from conversation_manager import ConversationManager
+from sentiment_analytics import SentimentAnalytics, normalize_emotion
+
+def result(sentiment, confidence=1.0, emotion=None):
+    """Build a sentiment result shaped like SentimentAnalyzer.analyze_sentiment output."""
+    return {
+        'sentiment': sentiment,
+        'confidence': confidence,
+        'emotion': emotion,
+        'explanation': 'test'
+    }
+
+def test_window_rollover():
+    """Test that old messages leave the rolling window."""
+    analytics = SentimentAnalytics(window_size=3)
+    for sentiment in ['positive', 'positive', 'positive', 'negative', 'negative']:
+        analytics.update(result(sentiment))
+
+    # Window now holds positive, negative, negative
+    assert abs(analytics.rolling_average() - (-1.0 / 3)) < 1e-12
+    assert abs(analytics.rolling_weighted_average() - (-1.0 / 3)) < 1e-12
+
+    analytics.update(result('negative'))
+    assert analytics.rolling_average() == -1.0
+
+def test_window_weighted_average():
+    """Test that low-confidence results count for less in the window."""
+    analytics = SentimentAnalytics(window_size=2)
+    analytics.update(result('positive', 0.9))
+    analytics.update(result('negative', 0.1))
+
+    assert analytics.rolling_average() == 0.0
+    assert abs(analytics.rolling_weighted_average() - 0.8) < 1e-12
+
+def test_zero_confidence_window():
+    """Test a window holding only failed analyses (confidence 0.0)."""
+    analytics = SentimentAnalytics(window_size=5)
+    for confidence in [0.8, 0.7, 0.35, 0.2, 0.8, 0.1, 0.7]:
+        analytics.update(result('positive', confidence))
+    for _ in range(5):
+        analytics.update(result('neutral', 0.0))
+
+    assert analytics.rolling_weighted_average() == 0.0
+    assert analytics.rolling_average() == 0.0
+
+def test_confidence_weighted_ema():
+    """Test the confidence-weighted exponential moving average."""
+    analytics = SentimentAnalytics(ema_alpha=0.5)
+    analytics.update(result('positive', 1.0))
+    assert analytics.ema == 1.0
+
+    analytics.update(result('negative', 0.5))
+    assert abs(analytics.ema - 0.5) < 1e-12
+
+    # A zero-confidence result does not move the average
+    analytics.update(result('negative', 0.0))
+    assert abs(analytics.ema - 0.5) < 1e-12
+
+def test_capacity_growth():
+    """Test that the trajectory survives the storage arrays being resized."""
+    analytics = SentimentAnalytics(capacity=64)
+    sentiments = ['positive', 'neutral', 'negative']
+    for i in range(150):
+        analytics.update(result(sentiments[i % 3], 0.8))
+
+    trajectory = analytics.get_trajectory()
+    assert analytics.count == 150
+    assert len(trajectory['score']) == 150
+    assert len(trajectory['ema']) == 150
+    assert trajectory['score'][:3] == [1.0, 0.0, -1.0]
+    assert trajectory['score'][-3:] == [1.0, 0.0, -1.0]
+    assert trajectory['ema'][-1] == analytics.ema
+    assert analytics.session_average() == 0.0
+
+def test_negative_streak():
+    """Test negative streak tracking and reset."""
+    analytics = SentimentAnalytics(streak_threshold=3)
+    for _ in range(3):
+        analytics.update(result('negative'))
+    assert analytics.in_negative_streak()
+    assert analytics.max_negative_streak == 3
+
+    analytics.update(result('neutral'))
+    assert analytics.negative_streak == 0
+    assert not analytics.in_negative_streak()
+
+    analytics.update(result('negative'))
+    assert analytics.negative_streak == 1
+    assert analytics.max_negative_streak == 3
+
+def test_emotion_normalization():
+    """Test mapping of free-form emotions onto the base emotions."""
+    assert normalize_emotion("joy") == 'happy'
+    assert normalize_emotion("Frustrated") == 'angry'
+    assert normalize_emotion("anxious") == 'afraid'
+    assert normalize_emotion("unhappy") == 'sad'
+    assert normalize_emotion("nostalgic") == 'other'
+    assert normalize_emotion(None) == 'none'
+    assert normalize_emotion("") == 'none'
+
+    # Noun forms and synonyms the model commonly reports
+    for emotion, expected in [("sadness", 'sad'), ("anger", 'angry'), ("fear", 'afraid'),
+                              ("happiness", 'happy'), ("joyful", 'happy'),
+                              ("frustration", 'angry'), ("anxiety", 'afraid'),
+                              ("excitement", 'happy'), ("disappointed", 'sad'),
+                              ("Mild Anxiety", 'afraid'), ("disgust", 'disgusted')]:
+        assert normalize_emotion(emotion) == expected, emotion
+
+    for label in ["none", "None", "null", "neutral", " Neutral "]:
+        assert normalize_emotion(label) == 'none', label
+
+    analytics = SentimentAnalytics()
+    for emotion in ["joy", "excited", "anxious", None]:
+        analytics.update(result('positive', emotion=emotion))
+
+    histogram = analytics.get_emotion_histogram()
+    assert histogram['happy'] == 2
+    assert histogram['afraid'] == 1
+    assert histogram['none'] == 1
+    assert analytics.get_dominant_emotion() == 'happy'
+
+def test_prompt_context_trend():
+    """Test the recent mood trend reported in the prompt context."""
+    # Confidence weighting alone must not look like a change in mood
+    analytics = SentimentAnalytics(window_size=2)
+    analytics.update(result('positive', 0.9))
+    analytics.update(result('negative', 0.3))
+    assert "improving" not in analytics.get_prompt_context()
+    assert "worse" not in analytics.get_prompt_context()
+
+    # No trend until the window holds fewer messages than the session
+    analytics = SentimentAnalytics(window_size=3)
+    for sentiment in ['positive', 'positive', 'negative']:
+        analytics.update(result(sentiment))
+    assert "worse" not in analytics.get_prompt_context()
+
+    for sentiment in ['negative', 'negative']:
+        analytics.update(result(sentiment))
+    assert "getting worse recently" in analytics.get_prompt_context()
+
+    for sentiment in ['positive', 'positive', 'positive']:
+        analytics.update(result(sentiment))
+    assert "improving recently" in analytics.get_prompt_context()
+
+def test_conversation_file_round_trip():
+    """Test rebuilding analytics from a saved conversation without the API."""
+    results = [
+        result('positive', 0.9, 'joy'),
+        result('negative', 0.6, 'sad'),
+        result('negative', 0.0, None),
+        result('neutral', 0.5, 'surprised')
+    ]
+
+    with tempfile.TemporaryDirectory() as storage_dir:
+        manager = ConversationManager(storage_dir=storage_dir)
+        live = SentimentAnalytics()
+        for i, sentiment_result in enumerate(results):
+            manager.add_message(f"message {i}", "user", sentiment_result)
+            manager.add_message(f"reply {i}", "assistant", None)
+            live.update(sentiment_result)
+        filepath = manager.save_conversation()
+
+        rebuilt = SentimentAnalytics.from_conversation_file(filepath)
+
+    assert rebuilt.get_summary() == live.get_summary()
+    assert rebuilt.get_trajectory() == live.get_trajectory()
+
+def test_malformed_conversation():
+    """Test loading conversations that are not a list of messages."""
+    analytics = SentimentAnalytics()
+    assert not analytics.load_conversation({"a": 1})
+    assert analytics.load_conversation(["text", None, {"role": "user", "sentiment": "positive"}])
+    assert analytics.count == 0
+
+    with tempfile.TemporaryDirectory() as storage_dir:
+        filepath = os.path.join(storage_dir, "bad.json")
+        with open(filepath, "w") as f:
+            json.dump({"a": 1}, f)
+
+        try:
+            SentimentAnalytics.from_conversation_file(filepath)
+            assert False, "Expected ValueError"
+        except ValueError:
+            pass
+
+if __name__ == "__main__":
+    test_window_rollover()
+    test_window_weighted_average()
+    test_zero_confidence_window()
+    test_confidence_weighted_ema()
+    test_capacity_growth()
+    test_negative_streak()
+    test_emotion_normalization()
+    test_prompt_context_trend()
+    test_conversation_file_round_trip()
+    test_malformed_conversation()
+    print("All sentiment analytics tests passed")